@@ -1,4 +1,5 @@
 import time
+import transform_functions as vb
 
 DIGITS = {
   "0": [
@@ -97,7 +98,7 @@ def displayTime():
   Displays the current time on the Vestaboard
   """
   # Initialize a blank board
-  board = [[0] * 22 for _ in range(6)]
+  board = vb.blankBoard()
 
   # Parse the current time
   hr = time.strftime("%I")
@@ -1,10 +1,10 @@
+import functools
 import requests
-import json
-import os
 import transform_functions as vb
-from dotenv import load_dotenv
+from datetime import datetime
+from zoneinfo import ZoneInfo
 
-load_dotenv()
+session = requests.Session()
 
 TEAMS = [
   {
@@ -230,7 +230,20 @@ def getSchedule():
   """
   Gets the MLB schedule for the current day
   """
-  mlb_resp = requests.get("http://statsapi.mlb.com/api/v1/schedule/games/?sportId=1")
+  # MLB schedules by the US Eastern date, so use it rather than the host's local date
+  league_day = datetime.now(ZoneInfo("America/New_York")).date().isoformat()
+  return list(_cachedSchedule(league_day))
+
+
+@functools.lru_cache(maxsize=1)
+def _cachedSchedule(day: str):
+  """
+  Memoized implementation of getSchedule. The schedule only changes with the date, so it is
+  fetched once per day rather than on every board refresh
+  Params:
+    day: the date of the schedule in YYYY-MM-DD format
+  """
+  mlb_resp = session.get(f"http://statsapi.mlb.com/api/v1/schedule/games/?sportId=1&date={day}", timeout=10)
   if mlb_resp.status_code != 200:
     print("Error getting MLB schedule")
     exit()
@@ -240,7 +253,7 @@ def getSchedule():
   games = data['dates'][0]['games']
   vb_game_info = [{'gameId': game['gamePk'], 'homeTeamId': game['teams']['home']['team']['id'], 'awayTeamId': game['teams']['away']['team']['id'], 'datetime': game['gameDate']} for game in games]
 
-  return vb_game_info
+  return tuple(vb_game_info)
 
 
 def gamePrioritizer(schedule):
@@ -274,7 +287,7 @@ def getLiveGameFeed(game_pk):
   Params:
     game_pk: the game id
   """
-  mlb_resp = requests.get(f"http://statsapi.mlb.com/api/v1.1/game/{game_pk}/feed/live")
+  mlb_resp = session.get(f"http://statsapi.mlb.com/api/v1.1/game/{game_pk}/feed/live", timeout=10)
   if mlb_resp.status_code != 200:
     print("Error getting MLB feed")
     exit()
@@ -313,8 +326,8 @@ def getLiveGameFeed(game_pk):
   # Construct the first line, which will display the score and inning
   line_1_string = f" {away_team['abbreviation']} {away_score} @ {home_team['abbreviation']} {home_score}"
   line_1 = vb.convertToCharacterCode(line_1_string)
-  line_1.insert(1, int(vb.COLORS[away_team['color']]))
-  line_1.insert(int(line_1.index(38) + 2), int(vb.COLORS[home_team['color']]))
+  line_1.insert(1, vb.COLORS[away_team['color']])
+  line_1.insert(int(line_1.index(38) + 2), vb.COLORS[home_team['color']])
   line_1 = vb.padRow(line_1, align="left")
   if data['gameData']['status']['abstractGameState'] == "Final":
     line_1[-3] = vb.CHARACTERS["F"]
@@ -1,12 +1,14 @@
 import transform_functions as vb
 
+# The header never changes, so it is converted to character codes once at import
+HEADER = vb.convertToCharacterCode(['green', 'green', 'blue', 'W', 'A', 'T', 'E', 'R', ' ', 'T', 'H', 'E', ' ', 'P', 'L', 'A', 'N', 'T', 'S', 'blue', 'green', 'green'])
+
 def plantReminder(plants):
   """
   Creates a board for the Vestaboard that reminds the user to water their plants
   Params:
     plants: a list of plants to be watered
   """
-  header = ['green', 'green', 'blue', 'W', 'A', 'T', 'E', 'R', ' ', 'T', 'H', 'E', ' ', 'P', 'L', 'A', 'N', 'T', 'S', 'blue', 'green', 'green']
   board = []
 
   if plants == []:
@@ -15,7 +17,7 @@ def plantReminder(plants):
 
   # To Do: Connect to a Plant Tracking API
 
-  board.append(vb.convertToCharacterCode(header))
+  board.append(HEADER.copy())
   plants.sort(key=len)
   for plant in plants:
     chars = vb.convertToCharacterCode(plant)
@@ -1,5 +1,4 @@
 import spotipy
-from math import ceil
 from spotipy.oauth2 import SpotifyOAuth
 from unidecode import unidecode
 import transform_functions as vb
@@ -11,6 +10,15 @@ load_dotenv()
 scope = "user-read-currently-playing"
 sp = spotipy.Spotify(auth_manager=SpotifyOAuth(scope=scope))
 
+# The padding and embellishments at the top of the board never change, so they are
+# converted to character codes once at import
+HEADER = vb.convertToCharacterCode(["GREEN", " ", " ", " ", " ", "N", "O", "w", " ", "P", "L", "A", "Y", "I", "N", "G", " ", " ", " ", " ", " ", "GREEN"])
+DESIGN = [
+  [66, 66, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 66, 66],
+  HEADER,
+  [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+]
+
 def getSongFromSpotify(current_message):
   """
   Gets the current song from Spotify and returns a board with the song name and artist name(s)
@@ -18,18 +26,9 @@ def getSongFromSpotify(current_message):
     current_message: the current message on the board
   """
 
-  # Add some padding and embellishments to the top of the board
-  header = ["GREEN", " ", " ", " ", " ", "N", "O", "w", " ", "P", "L", "A", "Y", "I", "N", "G", " ", " ", " ", " ", " ", "GREEN"]
-  board = []
-
-  header = vb.convertToCharacterCode(header)
-
-  design = [
-    [66, 66, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 66, 66],
-    header,
-    [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
-  ]
-  board += design
+  # Add some padding and embellishments to the top of the board, copying the rows so the
+  # shared template is never modified
+  board = [row.copy() for row in DESIGN]
 
   # Get the current song from Spotify and handle edge cases
   try:
@@ -59,9 +58,9 @@ def getSongFromSpotify(current_message):
   line3 = vb.convertToCharacterCode(line3)
   line3 = vb.padRow(line3)
 
-  board.append(line1[0:22])
-  board.append(line2[0:22])
-  board.append(line3[0:22])
+  board.append(line1)
+  board.append(line2)
+  board.append(line3)
 
   print("Will refresh in " + str(refresh / 1000) + " seconds")
 
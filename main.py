@@ -1,11 +1,6 @@
 import os
-import json
 import time
 import requests
-from installables import plant_reminder as pr
-from installables import spotify as sp
-from installables import mlb_scores as mlb
-from installables import clock as cl
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -14,6 +9,9 @@ VESTABOARD_API_KEY = os.getenv("VESTABOARD_API_KEY")
 PLANTREMINDER_INSTALLABLE_KEY = os.getenv("PLANTREMINDER_INSTALLABLE_KEY")
 PLANTREMINDER_INSTALLABLE_SECRET = os.getenv("PLANTREMINDER_INSTALLABLE_SECRET")
 
+session = requests.Session()
+session.headers.update({"X-Vestaboard-Read-Write-Key": VESTABOARD_API_KEY}) # type: ignore
+
 active_message = []
 mlb_cache = 0
 
@@ -25,7 +23,10 @@ def createBoard(app: str, active_message, mlb_cache = mlb_cache):
     active_message: the current message on the board
     mlb_cache: the current index of the mlb schedule (will be used in a future enhancement)
   """
+  # installables are imported lazily so only the selected app's dependencies are loaded;
+  # the spotify module, for example, builds its OAuth client as soon as it is imported
   if app == "plants":
+    from installables import plant_reminder as pr
     plants = ["Banana Plant", "Lipstick Plant", "Large Pothos", "Palm", "Birds of Paradise"]
     board = pr.plantReminder(plants)
     return board, 60000 * 15
@@ -33,12 +34,15 @@ def createBoard(app: str, active_message, mlb_cache = mlb_cache):
     print("Weather app not yet implemented")
     exit()
   elif app == "clock":
+    from installables import clock as cl
     board, refresh = cl.displayTime()
     return board, refresh
   elif app == "spotify":
+    from installables import spotify as sp
     board, refresh = sp.getSongFromSpotify(active_message)
     return board, refresh
   elif app == "mlb":
+    from installables import mlb_scores as mlb
     schedule = mlb.getSchedule()
     board, refresh = mlb.getLiveGameFeed(schedule[mlb_cache]['gameId'])
     if board != active_message:
@@ -64,16 +68,21 @@ def updateBoard(board):
   """
   print("Sending the following board to Vestaboard:")
   print(board)
-  r = requests.post(
+  r = session.post(
     url = "https://rw.vestaboard.com/",
-    headers={"X-Vestaboard-Read-Write-Key": VESTABOARD_API_KEY}, # type: ignore
-    json=board
+    json=board,
+    timeout=10
   )
 
   print(r, r.text)
 
 
 if __name__ == "__main__":
+  # fail fast rather than on the first board update
+  if not VESTABOARD_API_KEY:
+    print("VESTABOARD_API_KEY is not set")
+    exit()
+
   while True:
     board, refresh = createBoard("spotify", active_message)
     if board == active_message:
@@ -1,88 +1,106 @@
+import functools
+from types import MappingProxyType
+
 # These are some standard configurations to be used to transform 
 # data into a Vestaboard API compliant format
+# The character and color tables are read-only views so they can be safely shared
 COLUMNS = 22
 ROWS = 6
-CHARACTERS = {
-  ' ': '0',
-  'A': '1',
-  'B': '2',
-  'C': '3',
-  'D': '4',
-  'E': '5',
-  'F': '6',
-  'G': '7',
-  'H': '8',
-  'I': '9',
-  'J': '10',
-  'K': '11',
-  'L': '12',
-  'M': '13',
-  'N': '14',
-  'O': '15',
-  'P': '16',
-  'Q': '17',
-  'R': '18',
-  'S': '19',
-  'T': '20',
-  'U': '21',
-  'V': '22',
-  'W': '23',
-  'X': '24',
-  'Y': '25',
-  'Z': '26',
-  '1': '27',
-  '2': '28',
-  '3': '29',
-  '4': '30',
-  '5': '31',
-  '6': '32',
-  '7': '33',
-  '8': '34',
-  '9': '35',
-  '0': '36',
-  '!': '37',
-  '@': '38',
-  '#': '39',
-  '$': '40',
-  '(': '41',
-  ')': '42',
-  '-': '44',
-  '+': '46',
-  '&': '47',
-  '=': '48',
-  ';': '49',
-  ':': '50',
-  "'": '52',
-  '"': '53',
-  '%': '54',
-  ',': '55',
-  '.': '56',
-  '/': '59',
-  '?': '60',
-  '•': '62',
-  'RED': '63',
-  'ORANGE': '64',
-  'YELLOW': '65',
-  'GREEN': '66',
-  'BLUE': '67',
-  'PURPLE': '68',
-  'WHITE': '69',
-  'BLACK': '70',
-  'FILLED': '71',
-}
-COLORS = {
-  'red': '63',
-  'orange': '64',
-  'yellow': '65',
-  'green': '66',
-  'blue': '67',
-  'purple': '68',
-  'white': '69',
-  'black': '70',
-  'filled': '71',
-}
+CHARACTERS = MappingProxyType({
+  ' ': 0,
+  'A': 1,
+  'B': 2,
+  'C': 3,
+  'D': 4,
+  'E': 5,
+  'F': 6,
+  'G': 7,
+  'H': 8,
+  'I': 9,
+  'J': 10,
+  'K': 11,
+  'L': 12,
+  'M': 13,
+  'N': 14,
+  'O': 15,
+  'P': 16,
+  'Q': 17,
+  'R': 18,
+  'S': 19,
+  'T': 20,
+  'U': 21,
+  'V': 22,
+  'W': 23,
+  'X': 24,
+  'Y': 25,
+  'Z': 26,
+  '1': 27,
+  '2': 28,
+  '3': 29,
+  '4': 30,
+  '5': 31,
+  '6': 32,
+  '7': 33,
+  '8': 34,
+  '9': 35,
+  '0': 36,
+  '!': 37,
+  '@': 38,
+  '#': 39,
+  '$': 40,
+  '(': 41,
+  ')': 42,
+  '-': 44,
+  '+': 46,
+  '&': 47,
+  '=': 48,
+  ';': 49,
+  ':': 50,
+  "'": 52,
+  '"': 53,
+  '%': 54,
+  ',': 55,
+  '.': 56,
+  '/': 59,
+  '?': 60,
+  '•': 62,
+  'RED': 63,
+  'ORANGE': 64,
+  'YELLOW': 65,
+  'GREEN': 66,
+  'BLUE': 67,
+  'PURPLE': 68,
+  'WHITE': 69,
+  'BLACK': 70,
+  'FILLED': 71,
+})
+COLORS = MappingProxyType({
+  'red': 63,
+  'orange': 64,
+  'yellow': 65,
+  'green': 66,
+  'blue': 67,
+  'purple': 68,
+  'white': 69,
+  'black': 70,
+  'filled': 71,
+})
 BLANK_LINE = [0] * COLUMNS
 
+# Byte translation table used to convert plain ASCII strings to character codes in a single
+# C-level pass. Both cases of each letter map to the same code, and any byte without a
+# Vestaboard equivalent is listed in UNMAPPED_BYTES so translate() can drop it.
+TRANSLATION_TABLE = bytearray(range(256))
+_unmapped = set(range(256))
+for _char, _code in CHARACTERS.items():
+  if len(_char) == 1 and _char.isascii():
+    for _variant in (_char.upper(), _char.lower()):
+      TRANSLATION_TABLE[ord(_variant)] = _code
+      _unmapped.discard(ord(_variant))
+TRANSLATION_TABLE = bytes(TRANSLATION_TABLE)
+UNMAPPED_BYTES = bytes(sorted(_unmapped))
+del _unmapped, _char, _code, _variant
+
 def parseToLines(text: str):
   """
   Takes a string and splits it into a list of strings that are no longer than the max number
@@ -90,24 +108,45 @@ def parseToLines(text: str):
   Params:
     text: the string to be split
   """
-  split_message = text.split(" ")
+  return list(_cachedLines(text))
+
+
+@functools.lru_cache(maxsize=128)
+def _cachedLines(text: str):
+  """
+  Memoized implementation of parseToLines. Returns a tuple so cached results cannot be mutated
+  Params:
+    text: the string to be split
+  """
+  # greedily fill each line
   line_groups = []
-  current_line = ""
+  current_words = []
+  current_length = 0
+
+  for word in text.split(" "):
+    # words too long to fit on a line by themselves are broken across full-width lines
+    while len(word) > COLUMNS:
+      if current_words:
+        line_groups.append(" ".join(current_words))
+        current_words = []
+        current_length = 0
+      line_groups.append(word[:COLUMNS])
+      word = word[COLUMNS:]
 
-  for message in split_message:
-    if len(current_line) + len(message) + 1 <= COLUMNS:
-      current_line += message + " "
-    elif len(current_line) + len(message) == COLUMNS:
-      current_line += message
-    elif len(current_line) + len(message) + 1 > COLUMNS:
-      line_groups.append(current_line)
-      current_line = message + " "
+    # the length of the current line once this word and its separating space are added
+    next_length = current_length + len(word) + (1 if current_words else 0)
+    if current_words and next_length > COLUMNS:
+      line_groups.append(" ".join(current_words))
+      current_words = [word]
+      current_length = len(word)
+    else:
+      current_words.append(word)
+      current_length = next_length
 
-  if current_line != line_groups[-1] and current_line != "":
-    line_groups.append(current_line)
-    current_line = ""
+  if current_words:
+    line_groups.append(" ".join(current_words))
 
-  return line_groups
+  return tuple(line_groups)
 
 
 def convertToCharacterCode(input):
@@ -117,15 +156,62 @@ def convertToCharacterCode(input):
   Params:
     input: the string to be converted to character codes
   """
+  row, missing = _encodeCharacters(input)
+  for v in missing:
+    print(f"Character {v} not found in character dictionary")
+
+  return row
+
+
+def _encodeCharacters(input):
+  """
+  Implementation of convertToCharacterCode that returns the characters missing from the
+  character dictionary instead of reporting them
+  Params:
+    input: the string to be converted to character codes
+  """
+  # fast path for plain ASCII strings, which covers nearly every message sent to the board
+  if isinstance(input, str) and input.isascii():
+    row = _cachedTranslation(input)
+    missing = []
+    if len(row) != len(input):
+      missing = [v for v in input if ord(v) in UNMAPPED_BYTES]
+    return list(row), missing
+
+  # non-ASCII strings and token lists are uppercased per character or token, since uppercasing
+  # a whole string can expand some characters (e.g. 'ß' becomes 'SS')
   row = []
+  missing = []
   for v in input:
     try:
-      row.append(int(CHARACTERS[v.upper()]))
+      row.append(CHARACTERS[v.upper()])
     except KeyError:
-      print(f"Character {v} not found in character dictionary")
+      missing.append(v)
       continue
 
-  return row
+  return row, missing
+
+
+@functools.lru_cache(maxsize=1024)
+def _cachedTranslation(text: str):
+  """
+  Memoized ASCII fast path of convertToCharacterCode. Returns immutable bytes of character codes,
+  with any characters missing from the character dictionary dropped
+  Params:
+    text: the ASCII string to be converted to character codes
+  """
+  return text.encode("ascii").translate(TRANSLATION_TABLE, UNMAPPED_BYTES)
+
+
+def _leadingPadding(length: int, padding: int):
+  """
+  Calculates how much of the padding goes before the content when centering it. Odd length
+  content places the extra blank after, even length content places it before
+  Params:
+    length: the length of the content being centered
+    padding: the total amount of padding to split around the content
+  """
+  return (padding + 1 - (length & 1)) // 2
 
 
 def padRow(row: list, maxColumns = COLUMNS, align = "center"):
@@ -135,22 +221,34 @@ def padRow(row: list, maxColumns = COLUMNS, align = "center"):
   Params:
     row: the row to be padded
     maxColumns: the maximum number of columns on the Vestaboard
-    align: the alignment of the text on the board
-  """
-  while len(row) < maxColumns:
-    if align == "right":
-      row.insert(0, 0)
-    elif align == "center":
-      if len(row) % 2 == 1:
-        row.append(0)
-      else:
-        row.insert(0, 0)
-    elif align == "left":
-      row.append(0)
-    else:
-      "no alignment specified"
-  
-  return row
+    align: the alignment of the text on the board ("left", "center", or "right")
+  Rows that are already maxColumns long or longer are returned truncated to maxColumns
+  """
+  if align not in ("left", "center", "right"):
+    raise ValueError(f"Unsupported alignment: {align}")
+  if len(row) >= maxColumns:
+    return row[:maxColumns]
+
+  # split the padding between the two sides
+  padding = maxColumns - len(row)
+  if align == "left":
+    left_padding = 0
+  elif align == "right":
+    left_padding = padding
+  else:
+    left_padding = _leadingPadding(len(row), padding)
+
+  return [0] * left_padding + row + [0] * (padding - left_padding)
+
+
+def blankBoard(rows = ROWS, columns = COLUMNS):
+  """
+  Creates a board of blank rows, each its own list so rows can be written independently
+  Params:
+    rows: the number of rows on the board
+    columns: the number of columns in each row
+  """
+  return [[0] * columns for _ in range(rows)]
 
 
 def padBoard(board: list):
@@ -160,13 +258,16 @@ def padBoard(board: list):
   Params:
     board: the board to be padded
   """
-  while len(board) <= ROWS:
-    if len(board) % 2 == 1:
-      board.append([0] * COLUMNS)
-    else:
-      board.insert(0, [0] * COLUMNS)
+  missing_rows = ROWS + 1 - len(board)
+  if missing_rows <= 0:
+    return board
 
-  return board
+  # split the missing rows between top and bottom
+  top_rows = _leadingPadding(len(board), missing_rows)
+  top = blankBoard(top_rows)
+  bottom = blankBoard(missing_rows - top_rows)
+
+  return top + board + bottom
 
 
 def writeSimpleMessage(message):
@@ -175,21 +276,39 @@ def writeSimpleMessage(message):
   Params:
     message: the string to be converted to a board
   """
+  board, missing = _cachedSimpleMessage(message)
+  for v in missing:
+    print(f"Character {v} not found in character dictionary")
+
+  return [list(row) for row in board]
+
+
+@functools.lru_cache(maxsize=128)
+def _cachedSimpleMessage(message: str):
+  """
+  Memoized implementation of writeSimpleMessage. Returns the board as nested tuples so cached
+  boards cannot be mutated by callers, along with the characters missing from the character
+  dictionary so they can be reported on every call
+  Params:
+    message: the string to be converted to a board
+  """
 
   board = []
+  missing = []
 
-  lines = parseToLines(message)
+  lines = _cachedLines(message)
   
   # convert to character codes, add padding to rows, and write to board
   for line in lines:
-    row = convertToCharacterCode(line)
+    row, line_missing = _encodeCharacters(line)
+    missing += line_missing
     padded_row = padRow(row)
     board.append(padded_row)
 
   # add padding to vertically center the board
   board = padBoard(board)
 
-  return board
+  return tuple(tuple(row) for row in board), tuple(missing)
 
 def writeTwoColumns(messages: list, maxRows: int, rightWider = False, outerAlign = False):
   """
@@ -222,32 +341,21 @@ def writeTwoColumns(messages: list, maxRows: int, rightWider = False, outerAlign
     # will pad row if the message is shorter than the max length, or truncate if it is longer
     try:
       line = convertToCharacterCode(messages[i])
-      if len(line) < left_column_max:
-        line += '0' * (left_column_max - len(line))
-      if len(line) > left_column_max:
-        line = line[:left_column_max]
-      row += line
+      row += padRow(line, left_column_max, align="left")
     
     # add a blank row if there are no more messages in the list
     except IndexError:
-      row += '0' * left_column_max
+      row += [0] * left_column_max
 
     # write right column, starting a blank value to separate the columns
     # will pad row if the message is shorter than the max length, or truncate if it is longer
-    row += '0'
+    # if the outerAlign flag is set, the right column will be aligned to the right of the board
+    row.append(0)
     try:
       line = convertToCharacterCode(messages[i + maxRows])
-      if len(line) < right_column_max:
-        # if the outerAlign flag is set, the right column will be aligned to the right of the board
-        if outerAlign:
-          line = (['0'] * (right_column_max - len(line))) + line 
-        else:
-          line += '0' * (right_column_max - len(line))
-      if len(line) > right_column_max:
-        line = line[:right_column_max]
-      row += line
+      row += padRow(line, right_column_max, align="right" if outerAlign else "left")
     except IndexError:
-      row += '0' * right_column_max
+      row += [0] * right_column_max
 
     board.append(row)
 